@@ -1,9 +1,12 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 
 # ------------------------------------------------------------------------------
 # 請先在系統環境變數中設定 API Key，例如：
@@ -15,8 +18,16 @@ if not API_KEY:
 
 BASE_URL = "https://opendata.cwa.gov.tw/api/v1/rest/datastore"
 NOW_DATA_FOLDER = "./now_data_github"
+DATASET_IDS = ("O-A0001-001", "O-A0002-001", "O-A0003-001")
 os.makedirs(NOW_DATA_FOLDER, exist_ok=True)
 
+# 共用連線池：keep-alive 重用 TLS 連線，並對暫時性錯誤自動重試（各執行緒只讀取，不修改 session 狀態）
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_maxsize=len(DATASET_IDS),
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
 
 def fetch_data(dataset_id: str) -> List[Dict[str, Any]]:
     """
@@ -29,10 +40,10 @@ def fetch_data(dataset_id: str) -> List[Dict[str, Any]]:
         "Authorization": API_KEY,
         "format": "JSON"
     }
-    resp = requests.get(url, params=params, timeout=10, verify=False)
+    resp = SESSION.get(url, params=params, timeout=10, verify=False)
     if resp.status_code != 200:
         raise RuntimeError(f"Failed to fetch {dataset_id}: HTTP {resp.status_code}")
-    data = resp.json()
+    data = orjson.loads(resp.content)
     # 有些舊版 API 會在 JSON 最外層放入 success 欄位，若 false 也算錯誤
     if isinstance(data.get("success"), bool) and not data["success"]:
         raise RuntimeError(f"API {dataset_id} returned success=false. Message: {data.get('error', {}).get('message')}")
@@ -233,24 +244,34 @@ def save_to_json(stations: List[Dict[str, Any]], filename: str = "weather_data.j
     :param stations: merge_station_data 回傳的 List[Dict]
     :param filename: 輸出檔名
     """
-    with open(os.path.join(NOW_DATA_FOLDER, filename), mode="w", encoding="utf-8") as jsonfile:
-        json.dump(stations, jsonfile, ensure_ascii=False, indent=2)
+    # orjson 直接輸出 UTF-8 bytes（不跳脫中文），縮排與原本 indent=2 相同
+    with open(os.path.join(NOW_DATA_FOLDER, filename), mode="wb") as jsonfile:
+        jsonfile.write(orjson.dumps(stations, option=orjson.OPT_INDENT_2))
 
     print(f"Saved data to JSON file: {filename}")
 
 
+def fetch_all(dataset_ids: Sequence[str] = DATASET_IDS) -> List[List[Dict[str, Any]]]:
+    """
+    同時呼叫多個資料集的 API（I/O bound，等待網路回應期間不佔 CPU），
+    依 dataset_ids 的順序回傳各自的 records.Station。任一資料集失敗即拋出例外。
+    """
+    with ThreadPoolExecutor(max_workers=len(dataset_ids)) as executor:
+        return list(executor.map(fetch_data, dataset_ids))
+
+
 def main():
     try:
-        # 1. 取得自動氣象站資料 (每小時更新一次) :contentReference[oaicite:20]{index=20}
-        aw_locations = fetch_data("O-A0001-001")
+        # 0. 三個資料集並行下載，總等待時間約等於最慢的一支 API
+        aw_locations, rain_locations, cloud_locations = fetch_all()
+
+        # 1. 自動氣象站資料 (每小時更新一次) :contentReference[oaicite:20]{index=20}
         parsed_aw = parse_auto_weather(aw_locations)
 
-        # 2. 取得自動雨量站資料 (每 10 分鐘更新一次) :contentReference[oaicite:21]{index=21}
-        rain_locations = fetch_data("O-A0002-001")
+        # 2. 自動雨量站資料 (每 10 分鐘更新一次) :contentReference[oaicite:21]{index=21}
         parsed_rain = parse_auto_rain(rain_locations)
 
-        # 3. 取得現在天氣觀測報告 (含雲量，同樣每 10 分鐘更新) :contentReference[oaicite:22]{index=22}
-        cloud_locations = fetch_data("O-A0003-001")
+        # 3. 現在天氣觀測報告 (含雲量，同樣每 10 分鐘更新) :contentReference[oaicite:22]{index=22}
         parsed_cloud = parse_now_weather(cloud_locations)
 
         # 4. 合併資料